@@ -2,13 +2,26 @@
 # -*- coding: utf-8 -*-
 
 import random
+import base64
+import functools
+import logging
 import os
+import re
 import string
+import sys
+import types
+
+# Startup chatter goes through logging: formatting is deferred until the
+# level check passes, and AFL worker swarms no longer serialize on stdout.
+_log = logging.getLogger(__name__)
 
 # Constants
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-DICT_FILE = os.path.join(SCRIPT_DIR, "redis.dict")
-INPUT_DIR = os.path.join(SCRIPT_DIR, "input")
+# Paths are stored as bytes (os.fsencode) so open()/stat() dispatch straight
+# to the syscall without re-encoding the path on every AFL fork startup
+_SCRIPT_DIR_B = os.fsencode(SCRIPT_DIR)
+DICT_FILE = _SCRIPT_DIR_B + b"/redis.dict"
+INPUT_DIR = _SCRIPT_DIR_B + b"/input"
 
 # Redis connection defaults (from environment variables)
 REDIS_HOST = os.getenv("REDIS_HOST", "127.0.0.1")
@@ -16,25 +29,72 @@ REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 
 # Special characters to include in fuzzing
 SPECIAL_CHARS = "!@#$%^&*()-_=+[]{}|;:'\",.<>/?\\"
-ESCAPED_CHARS = [r"\\", r"\n", r"\r", r"\t", r"\"", r"\'", r"\0", r"\a", r"\b", r"\f", r"\v"]
+ESCAPED_CHARS = (r"\\", r"\n", r"\r", r"\t", r"\"", r"\'", r"\0", r"\a", r"\b", r"\f", r"\v")
+
+# Tuple variants for random.choice: sampling a tuple returns the stored
+# 1-char strings directly instead of slicing a fresh object out of a str.
+SPECIAL_CHARS_CHOICES = tuple(SPECIAL_CHARS)
+ALPHANUM_CHOICES = tuple(string.ascii_letters + string.digits)
+ALPHANUM_SPECIAL_CHOICES = ALPHANUM_CHOICES + SPECIAL_CHARS_CHOICES
+LETTER_CHOICES = tuple(string.ascii_letters)
+LOWER_CHOICES = tuple(string.ascii_lowercase)
+LOWER_ALNUM_CHOICES = tuple(string.ascii_lowercase + string.digits)
+PATTERN_CHOICES = LOWER_ALNUM_CHOICES + tuple("*?[]")
+HEX_CHOICES = tuple("0123456789abcdef")
+# Pool-of-pools for mixed_string: pick a pool, then pick a character/escape
+_MIXED_POOLS = (ALPHANUM_CHOICES, SPECIAL_CHARS_CHOICES, ESCAPED_CHARS)
+
+
+# Dedicated PRNG instance for all value generation.  Going through the
+# module-level random functions adds a bound-method indirection per call;
+# the generators below bind _RNG's methods directly instead.  Seeding it
+# from FUZZ_SEED gives deterministic reruns of a generated stream.
+_RNG = random.Random(os.getenv("FUZZ_SEED") or None)
+os.register_at_fork(after_in_child=_RNG.seed)
+
+# Per-pool buffers of pre-drawn characters.  Refilling a few thousand
+# characters in one random.choices() call amortizes its per-call setup
+# across many generated strings; draws are i.i.d. so consuming them in
+# slices preserves the distribution.  Keyed by id() — every caller passes
+# one of the immortal module-level pool tuples above.
+_CHAR_BUFFER_SIZE = 4096
+_char_buffers = {}
+# Children must not replay characters buffered before the fork; dropping
+# the buffers pairs with the random.seed() reseed in redis_fuzzer.
+os.register_at_fork(after_in_child=_char_buffers.clear)
+
+
+def random_chars(pool, min_len, max_len, _randint=_RNG.randint, _choices=_RNG.choices):
+    """Generates a random string of characters drawn from pool.
+
+    Characters come from a bulk-refilled buffer, so the per-string cost
+    is one randint, one slice and one join rather than a full
+    random.choices() round-trip per call.
+    """
+    n = _randint(min_len, max_len)
+    buf = _char_buffers.get(id(pool))
+    if buf is None or len(buf) < n:
+        buf = _choices(pool, k=max(_CHAR_BUFFER_SIZE, n))
+        _char_buffers[id(pool)] = buf
+    chunk = buf[-n:]
+    del buf[-n:]
+    return "".join(chunk)
 
 # Mix ratio between dictionary values and generated values (0-1)
 # 0: only generated values, 1: only dictionary values when available
 DICT_MIX_RATIO = 0.5  # Default value
-_dict_mix_ratio_env = os.getenv("DICT_MIX_RATIO")
-if _dict_mix_ratio_env is not None:
-    try:
-        _parsed_ratio = float(_dict_mix_ratio_env)
-        if 0.0 <= _parsed_ratio <= 1.0:
-            DICT_MIX_RATIO = _parsed_ratio
-        else:
-            print(
-                f"Warning: DICT_MIX_RATIO environment variable value '{_dict_mix_ratio_env}' is out of range [0.0, 1.0]. Using default {DICT_MIX_RATIO}."
-            )
-    except ValueError:
-        print(
-            f"Warning: Invalid DICT_MIX_RATIO environment variable value '{_dict_mix_ratio_env}'. Must be a float. Using default {DICT_MIX_RATIO}."
-        )
+try:
+    _parsed_ratio = float(os.getenv("DICT_MIX_RATIO", DICT_MIX_RATIO))
+except ValueError:
+    _parsed_ratio = -1.0
+if 0.0 <= _parsed_ratio <= 1.0:
+    DICT_MIX_RATIO = _parsed_ratio
+elif __debug__:
+    # Warn on stderr so AFL's stdout stays clean; python -O strips this branch
+    print(
+        f"Warning: DICT_MIX_RATIO environment variable must be a float in [0.0, 1.0]. Using default {DICT_MIX_RATIO}.",
+        file=sys.stderr,
+    )
 
 # List of supported Redis commands with parameters
 REDIS_COMMANDS = {
@@ -771,48 +831,137 @@ REDIS_COMMANDS = {
     "READWRITE": {"args": [], "optional_args": []},
 }
 
+def _intern_tree(value):
+    """Recursively sys.intern()s every string in a nested structure.
+
+    Tokens like "key" or "count" repeat hundreds of times across the
+    command table; interning collapses the duplicates to one object so
+    comparisons in the fuzz loop short-circuit on pointer identity.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [_intern_tree(item) for item in value]
+    if isinstance(value, dict):
+        return {_intern_tree(key): _intern_tree(item) for key, item in value.items()}
+    return value
+
+
+REDIS_COMMANDS = _intern_tree(REDIS_COMMANDS)
+
+# Optional-argument token kinds, resolved once at import by _prepare_optional_arg
+OPT_LITERAL = "lit"
+OPT_ALTERNATIVES = "alt"
+OPT_PAIR = "pair"
+
+
+def _prepare_optional_arg(token):
+    """Pre-splits one optional_args token into a (kind, payload, repeatable) triple.
+
+    Tokens are scanned and split once here so the generation loop only
+    dispatches on the kind tag instead of re-splitting strings per call:
+    "NX|XX" becomes a tuple of alternatives, "COUNT count" a keyword/value
+    pair and plain tokens stay literals.  A trailing " ..." marks the
+    token as repeatable.
+    """
+    repeatable = token.endswith("...")
+    if repeatable:
+        token = token[: token.rfind("...")].strip()
+    if " " in token:
+        first, rest = token.split(" ", 1)
+        if "|" in first:
+            return (OPT_ALTERNATIVES, tuple(first.split("|")), repeatable)
+        return (OPT_PAIR, (first, rest.split(" ")[0]), repeatable)
+    if "|" in token:
+        return (OPT_ALTERNATIVES, tuple(token.split("|")), repeatable)
+    return (OPT_LITERAL, token, repeatable)
+
+
+_shared_specs = {}
+
+
+def _share(spec):
+    """Hash-conses a spec tuple so commands with identical argument lists
+    (e.g. the MATCH/COUNT scan family or the GEO WITHDIST/WITHCOORD group)
+    share one object instead of carrying verbatim copies."""
+    return _shared_specs.setdefault(spec, spec)
+
+
+# Frozen per-command specs: (args, optional_args) as immutable tuples, with
+# the optional tokens pre-split into tagged triples.  The dict-of-lists
+# literal above stays the readable source of truth; the hot generation path
+# consults these flattened views instead of doing two dict lookups into
+# mutable lists and re-splitting token strings per command.
+COMMAND_SPECS = {
+    name: (
+        _share(tuple(info["args"])),
+        _share(tuple(_prepare_optional_arg(token) for token in info["optional_args"])),
+    )
+    for name, info in REDIS_COMMANDS.items()
+}
+
+# Frozen views of REDIS_COMMANDS for hot-path sampling.
+# _RNG.choice() on a tuple avoids rebuilding a list of ~200 keys per call.
+REDIS_COMMAND_NAMES = tuple(REDIS_COMMANDS)
+
+# Integer command ids: a name is translated with one dict lookup, after
+# which all spec accesses are flat tuple indexing with no string hashing.
+COMMAND_IDS = {name: command_id for command_id, name in enumerate(REDIS_COMMAND_NAMES)}
+COMMAND_SPECS_BY_ID = tuple(COMMAND_SPECS[name] for name in REDIS_COMMAND_NAMES)
+
+# All derived tables exist; expose the command table read-only so it cannot
+# be mutated accidentally and its pages stay clean for forkserver sharing.
+REDIS_COMMANDS = types.MappingProxyType(REDIS_COMMANDS)
+
 # Focus command logic
 _RAW_FOCUS_COMMANDS_ENV = os.getenv("REDIS_FOCUS_COMMANDS", "").strip()
-FOCUS_COMMANDS = []  # Will be empty list if commands are not set or invalid
+FOCUS_COMMANDS = ()  # Will be empty tuple if commands are not set or invalid
 
 if _RAW_FOCUS_COMMANDS_ENV:
-    # Split by comma and clean up each command
-    _potential_focus_commands = [
-        cmd.strip().upper() for cmd in _RAW_FOCUS_COMMANDS_ENV.split(",") if cmd.strip()
-    ]
-
-    valid_commands = []
-    invalid_commands = []
+    # One C-level upper() pass plus one regex scan tokenizes the whole
+    # variable: commas and surrounding whitespace delimit, interior single
+    # spaces stay (command names like "ACL CAT"), repeats collapse in the set.
+    _requested_focus_commands = set(
+        re.findall(r"[^,\s]+(?: [^,\s]+)*", _RAW_FOCUS_COMMANDS_ENV.upper())
+    )
 
-    for cmd in _potential_focus_commands:
-        if cmd in REDIS_COMMANDS:
-            valid_commands.append(cmd)
-        else:
-            invalid_commands.append(cmd)
+    # Validate against the command table with C-level set operations
+    valid_commands = sorted(_requested_focus_commands & REDIS_COMMANDS.keys())
+    invalid_commands = sorted(_requested_focus_commands - REDIS_COMMANDS.keys())
 
     if valid_commands:
-        FOCUS_COMMANDS = valid_commands
+        # Tuple: indexes in O(1) under random.choice and cannot grow
+        FOCUS_COMMANDS = tuple(valid_commands)
         if len(valid_commands) == 1:
-            print(
-                f"Info: Focus command enabled: '{valid_commands[0]}' (from environment variable REDIS_FOCUS_COMMANDS='{_RAW_FOCUS_COMMANDS_ENV}')"
+            _log.info(
+                "Focus command enabled: '%s' (from environment variable REDIS_FOCUS_COMMANDS='%s')",
+                valid_commands[0],
+                _RAW_FOCUS_COMMANDS_ENV,
             )
         else:
-            print(
-                f"Info: Focus commands enabled: {valid_commands} (from environment variable REDIS_FOCUS_COMMANDS='{_RAW_FOCUS_COMMANDS_ENV}')"
+            _log.info(
+                "Focus commands enabled: %s (from environment variable REDIS_FOCUS_COMMANDS='%s')",
+                valid_commands,
+                _RAW_FOCUS_COMMANDS_ENV,
             )
 
     if invalid_commands:
-        print(
-            f"Warning: Invalid commands '{invalid_commands}' from environment variable REDIS_FOCUS_COMMANDS are not valid command keys in REDIS_COMMANDS and will be ignored."
+        _log.warning(
+            "Invalid commands '%s' from environment variable REDIS_FOCUS_COMMANDS are not valid "
+            "command keys in REDIS_COMMANDS and will be ignored.",
+            invalid_commands,
         )
 
     if not valid_commands:
-        print(
-            f"Warning: No valid commands found in environment variable REDIS_FOCUS_COMMANDS='{_RAW_FOCUS_COMMANDS_ENV}'. Focus commands will be disabled."
+        _log.warning(
+            "No valid commands found in environment variable REDIS_FOCUS_COMMANDS='%s'. "
+            "Focus commands will be disabled.",
+            _RAW_FOCUS_COMMANDS_ENV,
         )
 else:
-    print(
-        "Info: Environment variable REDIS_FOCUS_COMMANDS is not set or empty. Focus commands will be disabled."
+    _log.info(
+        "Environment variable REDIS_FOCUS_COMMANDS is not set or empty. "
+        "Focus commands will be disabled."
     )
 
 # Excluded commands logic
@@ -821,276 +970,256 @@ _RAW_EXCLUDE_COMMANDS_ENV = os.getenv("REDIS_EXCLUDE_COMMANDS", "").strip()
 
 if _RAW_EXCLUDE_COMMANDS_ENV:
     # If environment variable is provided, use it to define excluded commands
-    EXCLUDED_COMMANDS = [cmd.strip().upper() for cmd in _RAW_EXCLUDE_COMMANDS_ENV.split(",") if cmd.strip()]
+    _excluded = [cmd.strip().upper() for cmd in _RAW_EXCLUDE_COMMANDS_ENV.split(",") if cmd.strip()]
 else:
     # Fallback to default list
-    EXCLUDED_COMMANDS = _DEFAULT_EXCLUDED_COMMANDS.copy()
+    _excluded = _DEFAULT_EXCLUDED_COMMANDS
 
 # Validate excluded commands and issue warnings for unknown ones
-_invalid_excludes = [cmd for cmd in EXCLUDED_COMMANDS if cmd not in REDIS_COMMANDS]
+_invalid_excludes = [cmd for cmd in _excluded if cmd not in REDIS_COMMANDS]
 if _invalid_excludes:
-    print(
-        f"Warning: Invalid commands in REDIS_EXCLUDE_COMMANDS will be ignored: {_invalid_excludes}"
+    _log.warning(
+        "Invalid commands in REDIS_EXCLUDE_COMMANDS will be ignored: %s", _invalid_excludes
     )
-    EXCLUDED_COMMANDS = [cmd for cmd in EXCLUDED_COMMANDS if cmd in REDIS_COMMANDS]
+    _excluded = [cmd for cmd in _excluded if cmd in REDIS_COMMANDS]
+
+# Frozenset: the generators probe membership per command, so checks must
+# be O(1), and exclusions never change after import
+EXCLUDED_COMMANDS = frozenset(_excluded)
 
 if EXCLUDED_COMMANDS:
-    print(f"Info: The following commands will be excluded from fuzzing: {EXCLUDED_COMMANDS}")
+    _log.info("The following commands will be excluded from fuzzing: %s", sorted(EXCLUDED_COMMANDS))
 else:
-    print("Info: No commands are excluded from fuzzing.")
+    _log.info("No commands are excluded from fuzzing.")
+
+# Frozen choice pools: hoisted out of the generator lambdas below so a
+# draw indexes an existing tuple instead of rebuilding a list literal
+# on every call.
+_SECTION_CHOICES = (
+    "SERVER",
+    "CLIENTS",
+    "MEMORY",
+    "PERSISTENCE",
+    "STATS",
+    "REPLICATION",
+    "CPU",
+    "COMMANDSTATS",
+    "CLUSTER",
+    "KEYSPACE",
+)
+_UNIT_CHOICES = ("m", "km", "ft", "mi")
+_OPERATION_CHOICES = ("AND", "OR", "XOR", "NOT")
+_BIT_CHOICES = ("0", "1")
+_CATEGORYNAME_CHOICES = (
+    "string",
+    "list",
+    "set",
+    "sorted_set",
+    "hash",
+    "pubsub",
+    "transaction",
+    "connection",
+    "server",
+    "scripting",
+)
+_RULE_CHOICES = (
+    "on",
+    "off",
+    "nopass",
+    "+@all",
+    "-@all",
+    "+@string",
+    "-@dangerous",
+    ">password",
+    "<password",
+)
+_NEWLINE_CHOICES = (r"\n", r"\r\n")
+_ALGORITHM_CHOICES = ("FLAT", "HNSW")
+_DISTANCE_METRIC_CHOICES = ("L2", "IP", "COSINE")
+_DATA_TYPE_CHOICES = ("FLOAT32", "FLOAT64")
+_HOST_CHOICES = ("localhost", "127.0.0.1", "redis-server")
+_SUBCOMMAND_CHOICES = ("IMPORTING", "MIGRATING", "NODE", "STABLE")
+_EVENT_CHOICES = (
+    "command",
+    "fast-command",
+    "fork",
+    "aof-fsync-always",
+    "aof-write",
+    "expire-cycle",
+    "eviction",
+)
+_OPTION_CHOICES = ("ACK", "GETACK", "CAPA", "LISTENING-PORT")
+_PATH_CHOICES = ("/path/to/module.so", "./module.so")
+_DEFAULT_LANG_CHOICES = ("english", "spanish", "french", "chinese", "japanese", "arabic")
+_STOPWORD_CHOICES = ("a", "an", "the", "and", "or", "but", "in", "on", "at")
+_QUERY_CHOICES = ("@title:hello", "*", "@tags:{important}", "@num:[0 100]")
+_TERM_CHOICES = ("word", "term", "phrase", "concept")
+
+# Interned id prefixes shared by the generators below.  sys.intern keeps
+# one canonical copy of each and lets later equality checks on values
+# that start identically hit the pointer-comparison fast path.
+_CHANNEL_PREFIX = sys.intern("channel:")
+_CONSUMER_PREFIX = sys.intern("consumer:")
+_DEST_PREFIX = sys.intern("dest:")
+_DST_PREFIX = sys.intern("dst:")
+_FIELD_PREFIX = sys.intern("field:")
+_GROUP_PREFIX = sys.intern("group:")
+_IDX_PREFIX = sys.intern("idx:")
+_ITEM_PREFIX = sys.intern("item:")
+_KEY1_PREFIX = sys.intern("key1:")
+_KEY2_PREFIX = sys.intern("key2:")
+_KEY_PREFIX = sys.intern("key:")
+_LIB_PREFIX = sys.intern("lib:")
+_MEMBER_PREFIX = sys.intern("member:")
+_SHARD_PREFIX = sys.intern("shard:")
+_SRC_PREFIX = sys.intern("src:")
 
 # Data types for random value generation
 DATA_TYPES = {
-    "string": lambda: "".join(
-        random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789")
-        for _ in range(random.randint(1, 20))
-    ),
-    "integer": lambda: str(random.randint(-1000000, 1000000)),
-    "float": lambda: str(random.uniform(-1000000, 1000000)),
-    "key": lambda: "key:"
-    + "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(1, 10))
-    ),
-    "field": lambda: "field:"
-    + "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(1, 10))
-    ),
-    "member": lambda: "member:"
-    + "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(1, 10))
+    "string": lambda _chars=random_chars: _chars(ALPHANUM_CHOICES, 1, 20),
+    "integer": lambda _randint=_RNG.randint: "%d" % _randint(-1000000, 1000000),
+    "float": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(-1000000, 1000000),
+    "key": lambda _chars=random_chars, _p=_KEY_PREFIX: _p + _chars(LOWER_ALNUM_CHOICES, 1, 10),
+    "field": lambda _chars=random_chars, _p=_FIELD_PREFIX: _p + _chars(LOWER_ALNUM_CHOICES, 1, 10),
+    "member": lambda _chars=random_chars, _p=_MEMBER_PREFIX: (
+        _p + _chars(LOWER_ALNUM_CHOICES, 1, 10)
     ),
-    "channel": lambda: "channel:"
-    + "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(1, 10))
-    ),
-    "pattern": lambda: "*:"
-    + "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789*?[]")
-        for _ in range(random.randint(1, 10))
-    ),
-    "score": lambda: str(random.uniform(-1000, 1000)),
-    "index": lambda: str(random.randint(-100, 100)),
-    "count": lambda: str(random.randint(1, 100)),
-    "cursor": lambda: str(random.randint(0, 10000)),
-    "increment": lambda: str(random.randint(-100, 100)),
-    "decrement": lambda: str(random.randint(-100, 100)),
-    "seconds": lambda: str(random.randint(1, 3600)),
-    "milliseconds": lambda: str(random.randint(1, 3600000)),
-    "offset": lambda: str(random.randint(0, 100)),
-    "start": lambda: str(random.randint(-100, 100)),
-    "end": lambda: str(random.randint(-100, 100)),
-    "stop": lambda: str(random.randint(-100, 100)),
-    "min": lambda: str(random.randint(-1000, 1000)),
-    "max": lambda: str(random.randint(-1000, 1000)),
-    "subcommand": lambda: random.choice(["CHANNELS", "NUMPAT", "NUMSUB"]),
-    "section": lambda: random.choice(
-        [
-            "SERVER",
-            "CLIENTS",
-            "MEMORY",
-            "PERSISTENCE",
-            "STATS",
-            "REPLICATION",
-            "CPU",
-            "COMMANDSTATS",
-            "CLUSTER",
-            "KEYSPACE",
-        ]
-    ),
-    "message": lambda: "".join(
-        random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789")
-        for _ in range(random.randint(1, 50))
-    ),
-    "value": lambda: "".join(
-        random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789")
-        for _ in range(random.randint(1, 50))
-    ),
-    "element": lambda: "".join(
-        random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789")
-        for _ in range(random.randint(1, 50))
+    "channel": lambda _chars=random_chars, _p=_CHANNEL_PREFIX: (
+        _p + _chars(LOWER_ALNUM_CHOICES, 1, 10)
     ),
+    "pattern": lambda _chars=random_chars: "*:" + _chars(PATTERN_CHOICES, 1, 10),
+    "score": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(-1000, 1000),
+    "count": lambda _randint=_RNG.randint: "%d" % _randint(1, 100),
+    "cursor": lambda _randint=_RNG.randint: "%d" % _randint(0, 10000),
+    "increment": lambda _randint=_RNG.randint: "%d" % _randint(-100, 100),
+    "decrement": lambda _randint=_RNG.randint: "%d" % _randint(-100, 100),
+    "seconds": lambda _randint=_RNG.randint: "%d" % _randint(1, 3600),
+    "milliseconds": lambda _randint=_RNG.randint: "%d" % _randint(1, 3600000),
+    "offset": lambda _randint=_RNG.randint: "%d" % _randint(0, 100),
+    "start": lambda _randint=_RNG.randint: "%d" % _randint(-100, 100),
+    "end": lambda _randint=_RNG.randint: "%d" % _randint(-100, 100),
+    "stop": lambda _randint=_RNG.randint: "%d" % _randint(-100, 100),
+    "min": lambda _randint=_RNG.randint: "%d" % _randint(-1000, 1000),
+    "max": lambda _randint=_RNG.randint: "%d" % _randint(-1000, 1000),
+    "section": lambda _choice=_RNG.choice: _choice(_SECTION_CHOICES),
+    "message": lambda _chars=random_chars: _chars(ALPHANUM_CHOICES, 1, 50),
+    "value": lambda _chars=random_chars: _chars(ALPHANUM_CHOICES, 1, 50),
+    "element": lambda _chars=random_chars: _chars(ALPHANUM_CHOICES, 1, 50),
     "script": lambda: "return {KEYS[1],ARGV[1]}",
-    "numkeys": lambda: str(random.randint(0, 3)),
-    "sha1": lambda: "".join(random.choice("0123456789abcdef") for _ in range(40)),
-    "password": lambda: "".join(
-        random.choice(string.ascii_letters + string.digits) for _ in range(random.randint(4, 12))
-    ),
-    "username": lambda: "".join(
-        random.choice(string.ascii_letters) for _ in range(random.randint(3, 8))
-    ),
-    "longitude": lambda: str(random.uniform(-180, 180)),
-    "latitude": lambda: str(random.uniform(-90, 90)),
-    "radius": lambda: str(random.uniform(0, 100)),
-    "unit": lambda: random.choice(["m", "km", "ft", "mi"]),
-    "ID": lambda: f"{random.randint(0, 1000)}-{random.randint(0, 1000)}",
-    "operation": lambda: random.choice(["AND", "OR", "XOR", "NOT"]),
+    "numkeys": lambda _randint=_RNG.randint: "%d" % _randint(0, 3),
+    "sha1": lambda _randbytes=_RNG.randbytes: _randbytes(20).hex(),
+    "password": lambda _chars=random_chars: _chars(ALPHANUM_CHOICES, 4, 12),
+    "username": lambda _chars=random_chars: _chars(LETTER_CHOICES, 3, 8),
+    "longitude": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(-180, 180),
+    "latitude": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(-90, 90),
+    "radius": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(0, 100),
+    "unit": lambda _choice=_RNG.choice: _choice(_UNIT_CHOICES),
+    "ID": lambda _randint=_RNG.randint: f"{_randint(0, 1000)}-{_randint(0, 1000)}",
+    "operation": lambda _choice=_RNG.choice: _choice(_OPERATION_CHOICES),
     "destkey": lambda: "key",
     "sourcekey": lambda: "key",
     "arg": lambda: "string",
-    "bit": lambda: random.choice(["0", "1"]),
+    "bit": lambda _choice=_RNG.choice: _choice(_BIT_CHOICES),
     # New data types
-    "categoryname": lambda: random.choice(
-        [
-            "string",
-            "list",
-            "set",
-            "sorted_set",
-            "hash",
-            "pubsub",
-            "transaction",
-            "connection",
-            "server",
-            "scripting",
-        ]
-    ),
-    "command": lambda: random.choice(list(REDIS_COMMANDS.keys())),
-    "bits": lambda: str(random.randint(1, 256)),
-    "rule": lambda: random.choice(
-        [
-            "on",
-            "off",
-            "nopass",
-            "+@all",
-            "-@all",
-            "+@string",
-            "-@dangerous",
-            ">password",
-            "<password",
-        ]
-    ),
-    "groupname": lambda: "group:"
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8))),
-    "consumername": lambda: "consumer:"
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8))),
-    "min-idle-time": lambda: str(random.randint(1, 10000)),
-    "ms-unix-time": lambda: str(random.randint(1000000000, 2000000000)),
-    "last-id": lambda: f"{random.randint(0, 1000)}-{random.randint(0, 1000)}",
-    "weight": lambda: str(random.uniform(0.1, 10.0)),
-    "limit": lambda: str(random.randint(1, 100)),
-    "destination": lambda: "dest:"
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8))),
-    "dst": lambda: "dst:"
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8))),
-    "src": lambda: "src:"
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8))),
-    "item": lambda: "item:"
-    + "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(1, 10))
+    "categoryname": lambda _choice=_RNG.choice: _choice(_CATEGORYNAME_CHOICES),
+    "command": lambda _choice=_RNG.choice: _choice(REDIS_COMMAND_NAMES),
+    "bits": lambda _randint=_RNG.randint: "%d" % _randint(1, 256),
+    "rule": lambda _choice=_RNG.choice: _choice(_RULE_CHOICES),
+    "groupname": lambda _chars=random_chars, _p=_GROUP_PREFIX: _p + _chars(LOWER_CHOICES, 3, 8),
+    "consumername": lambda _chars=random_chars, _p=_CONSUMER_PREFIX: (
+        _p + _chars(LOWER_CHOICES, 3, 8)
     ),
-    "error_rate": lambda: str(random.uniform(0.001, 0.1)),
-    "capacity": lambda: str(random.randint(100, 10000)),
-    "expansion": lambda: str(random.randint(1, 5)),
-    "iterator": lambda: str(random.randint(0, 100)),
-    "data": lambda: "".join(
-        random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789")
-        for _ in range(random.randint(10, 50))
-    ),
-    "bucketsize": lambda: str(random.randint(1, 10)),
-    "maxiterations": lambda: str(random.randint(10, 100)),
-    "error": lambda: str(random.uniform(0.01, 0.1)),
-    "probability": lambda: str(random.uniform(0.01, 0.1)),
-    "width": lambda: str(random.randint(10, 100)),
-    "depth": lambda: str(random.randint(5, 20)),
-    "path": lambda: random.choice(["$", "$[0]", "$.field", "$.nested.field", "$..field"]),
-    "indent": lambda: str(random.randint(0, 4)),
-    "newline": lambda: random.choice(["\\n", "\\r\\n"]),
+    "min-idle-time": lambda _randint=_RNG.randint: "%d" % _randint(1, 10000),
+    "ms-unix-time": lambda _randint=_RNG.randint: "%d" % _randint(1000000000, 2000000000),
+    "last-id": lambda _randint=_RNG.randint: f"{_randint(0, 1000)}-{_randint(0, 1000)}",
+    "weight": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(0.1, 10.0),
+    "limit": lambda _randint=_RNG.randint: "%d" % _randint(1, 100),
+    "destination": lambda _chars=random_chars, _p=_DEST_PREFIX: _p + _chars(LOWER_CHOICES, 3, 8),
+    "dst": lambda _chars=random_chars, _p=_DST_PREFIX: _p + _chars(LOWER_CHOICES, 3, 8),
+    "src": lambda _chars=random_chars, _p=_SRC_PREFIX: _p + _chars(LOWER_CHOICES, 3, 8),
+    "item": lambda _chars=random_chars, _p=_ITEM_PREFIX: _p + _chars(LOWER_ALNUM_CHOICES, 1, 10),
+    "error_rate": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(0.001, 0.1),
+    "capacity": lambda _randint=_RNG.randint: "%d" % _randint(100, 10000),
+    "expansion": lambda _randint=_RNG.randint: "%d" % _randint(1, 5),
+    "iterator": lambda _randint=_RNG.randint: "%d" % _randint(0, 100),
+    "data": lambda _chars=random_chars: _chars(ALPHANUM_CHOICES, 10, 50),
+    "bucketsize": lambda _randint=_RNG.randint: "%d" % _randint(1, 10),
+    "maxiterations": lambda _randint=_RNG.randint: "%d" % _randint(10, 100),
+    "error": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(0.01, 0.1),
+    "probability": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(0.01, 0.1),
+    "width": lambda _randint=_RNG.randint: "%d" % _randint(10, 100),
+    "depth": lambda _randint=_RNG.randint: "%d" % _randint(5, 20),
+    "indent": lambda _randint=_RNG.randint: "%d" % _randint(0, 4),
+    "newline": lambda _choice=_RNG.choice: _choice(_NEWLINE_CHOICES),
     "space": lambda: " ",
-    "number": lambda: str(random.uniform(-100, 100)),
-    "id": lambda: "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(3, 8))
-    ),
+    "number": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(-100, 100),
+    "id": lambda _chars=random_chars: _chars(LOWER_ALNUM_CHOICES, 3, 8),
     "vector": lambda: "["
-    + ",".join(str(random.uniform(-1, 1)) for _ in range(random.randint(2, 10)))
+    + ",".join("%.6g" % _RNG.uniform(-1, 1) for _ in range(_RNG.randint(2, 10)))
     + "]",
-    "dimensions": lambda: str(random.randint(2, 128)),
-    "algorithm": lambda: random.choice(["FLAT", "HNSW"]),
-    "m": lambda: str(random.randint(5, 50)),
-    "ef_construction": lambda: str(random.randint(10, 500)),
-    "distance_metric": lambda: random.choice(["L2", "IP", "COSINE"]),
-    "initial_cap": lambda: str(random.randint(1000, 10000)),
-    "data_type": lambda: random.choice(["FLOAT32", "FLOAT64"]),
-    "ef_runtime": lambda: str(random.randint(10, 1000)),
+    "dimensions": lambda _randint=_RNG.randint: "%d" % _randint(2, 128),
+    "algorithm": lambda _choice=_RNG.choice: _choice(_ALGORITHM_CHOICES),
+    "m": lambda _randint=_RNG.randint: "%d" % _randint(5, 50),
+    "ef_construction": lambda _randint=_RNG.randint: "%d" % _randint(10, 500),
+    "distance_metric": lambda _choice=_RNG.choice: _choice(_DISTANCE_METRIC_CHOICES),
+    "initial_cap": lambda _randint=_RNG.randint: "%d" % _randint(1000, 10000),
+    "data_type": lambda _choice=_RNG.choice: _choice(_DATA_TYPE_CHOICES),
+    "ef_runtime": lambda _randint=_RNG.randint: "%d" % _randint(10, 1000),
     "attributes": lambda: '{"'
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8)))
+    + random_chars(LOWER_CHOICES, 3, 8)
     + '":"'
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8)))
+    + random_chars(LOWER_CHOICES, 3, 8)
     + '"}',
-    "host": lambda: random.choice(["localhost", "127.0.0.1", "redis-server"]),
-    "port": lambda: str(random.randint(1024, 65535)),
-    "numreplicas": lambda: str(random.randint(0, 5)),
-    "numlocal": lambda: str(random.randint(0, 5)),
-    "index1": lambda: str(random.randint(0, 15)),
-    "index2": lambda: str(random.randint(0, 15)),
-    "timeout": lambda: str(random.randint(100, 10000)),
-    "group": lambda: "group:"
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8))),
+    "host": lambda _choice=_RNG.choice: _choice(_HOST_CHOICES),
+    "port": lambda _randint=_RNG.randint: "%d" % _randint(1024, 65535),
+    "numreplicas": lambda _randint=_RNG.randint: "%d" % _randint(0, 5),
+    "numlocal": lambda _randint=_RNG.randint: "%d" % _randint(0, 5),
+    "index1": lambda _randint=_RNG.randint: "%d" % _randint(0, 15),
+    "index2": lambda _randint=_RNG.randint: "%d" % _randint(0, 15),
+    "timeout": lambda _randint=_RNG.randint: "%d" % _randint(100, 10000),
+    "group": lambda _chars=random_chars, _p=_GROUP_PREFIX: _p + _chars(LOWER_CHOICES, 3, 8),
     # New data types
-    "slot": lambda: str(random.randint(0, 16383)),
-    "node-id": lambda: "".join(random.choice("0123456789abcdef") for _ in range(40)),
-    "epoch": lambda: str(random.randint(1, 10000)),
-    "subcommand": lambda: random.choice(["IMPORTING", "MIGRATING", "NODE", "STABLE"]),
-    "cluster-bus-port": lambda: str(random.randint(10000, 30000)),
-    "event": lambda: random.choice(
-        [
-            "command",
-            "fast-command",
-            "fork",
-            "aof-fsync-always",
-            "aof-write",
-            "expire-cycle",
-            "eviction",
-        ]
-    ),
-    "library": lambda: "lib:"
-    + "".join(random.choice(string.ascii_lowercase) for _ in range(random.randint(3, 10))),
+    "slot": lambda _randint=_RNG.randint: "%d" % _randint(0, 16383),
+    "node-id": lambda _randbytes=_RNG.randbytes: _randbytes(20).hex(),
+    "epoch": lambda _randint=_RNG.randint: "%d" % _randint(1, 10000),
+    "subcommand": lambda _choice=_RNG.choice: _choice(_SUBCOMMAND_CHOICES),
+    "cluster-bus-port": lambda _randint=_RNG.randint: "%d" % _randint(10000, 30000),
+    "event": lambda _choice=_RNG.choice: _choice(_EVENT_CHOICES),
+    "library": lambda _chars=random_chars, _p=_LIB_PREFIX: _p + _chars(LOWER_CHOICES, 3, 10),
     "function": lambda: "myfunc",
     "code": lambda: "redis.register_function('myfunc', function() return 'hello' end)",
-    "payload": lambda: "".join(
-        random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")
-        for _ in range(random.randint(20, 100))
-    ),
-    "shardchannel": lambda: "shard:"
-    + "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(3, 8))
-    ),
-    "option": lambda: random.choice(["ACK", "GETACK", "CAPA", "LISTENING-PORT"]),
-    "key1": lambda: "key1:"
-    + "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(1, 10))
-    ),
-    "key2": lambda: "key2:"
-    + "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(1, 10))
-    ),
-    "len": lambda: str(random.randint(1, 10)),
-    "path": lambda: random.choice(["/path/to/module.so", "./module.so"]),
-    "name": lambda: "".join(
-        random.choice(string.ascii_lowercase) for _ in range(random.randint(3, 10))
-    ),
-    "ip": lambda: ".".join(str(random.randint(0, 255)) for _ in range(4)),
-    "frequency": lambda: str(random.randint(1, 100)),
-    "serialized-value": lambda: "".join(
-        random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")
-        for _ in range(random.randint(20, 100))
+    "payload": lambda: base64.b64encode(_RNG.randbytes(75))[
+        : _RNG.randint(20, 100)
+    ].decode(),
+    "shardchannel": lambda _chars=random_chars, _p=_SHARD_PREFIX: (
+        _p + _chars(LOWER_ALNUM_CHOICES, 3, 8)
     ),
+    "option": lambda _choice=_RNG.choice: _choice(_OPTION_CHOICES),
+    "key1": lambda _chars=random_chars, _p=_KEY1_PREFIX: _p + _chars(LOWER_ALNUM_CHOICES, 1, 10),
+    "key2": lambda _chars=random_chars, _p=_KEY2_PREFIX: _p + _chars(LOWER_ALNUM_CHOICES, 1, 10),
+    "len": lambda _randint=_RNG.randint: "%d" % _randint(1, 10),
+    "path": lambda _choice=_RNG.choice: _choice(_PATH_CHOICES),
+    "name": lambda _chars=random_chars: _chars(LOWER_CHOICES, 3, 10),
+    "ip": lambda _randint=_RNG.randint: ".".join("%d" % _randint(0, 255) for _ in range(4)),
+    "frequency": lambda _randint=_RNG.randint: "%d" % _randint(1, 100),
+    "serialized-value": lambda: base64.b64encode(_RNG.randbytes(75))[
+        : _RNG.randint(20, 100)
+    ].decode(),
     # Rate Limiter parameters
-    "index": lambda: "idx:"
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8))),
+    "index": lambda _chars=random_chars, _p=_IDX_PREFIX: _p + _chars(LOWER_CHOICES, 3, 8),
     "filter": lambda: "@field:{tag}",
-    "default_lang": lambda: random.choice(
-        ["english", "spanish", "french", "chinese", "japanese", "arabic"]
-    ),
+    "default_lang": lambda _choice=_RNG.choice: _choice(_DEFAULT_LANG_CHOICES),
     "lang_field": lambda: "language",
-    "default_score": lambda: str(random.uniform(0.1, 10.0)),
+    "default_score": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(0.1, 10.0),
     "score_field": lambda: "score",
-    "stopword": lambda: random.choice(["a", "an", "the", "and", "or", "but", "in", "on", "at"]),
-    "query": lambda: random.choice(["@title:hello", "*", "@tags:{important}", "@num:[0 100]"]),
-    "synonym_group_id": lambda: "group" + str(random.randint(1, 1000)),
-    "term": lambda: random.choice(["word", "term", "phrase", "concept"]),
-    "max_burst": lambda: str(random.randint(0, 30)),
-    "count_per_period": lambda: str(random.randint(10, 1000)),
-    "period": lambda: str(random.randint(1, 3600)),
-    "quantity": lambda: str(random.randint(1, 10)),
+    "stopword": lambda _choice=_RNG.choice: _choice(_STOPWORD_CHOICES),
+    "query": lambda _choice=_RNG.choice: _choice(_QUERY_CHOICES),
+    "synonym_group_id": lambda _randint=_RNG.randint: "group" + "%d" % _randint(1, 1000),
+    "term": lambda _choice=_RNG.choice: _choice(_TERM_CHOICES),
+    "max_burst": lambda _randint=_RNG.randint: "%d" % _randint(0, 30),
+    "count_per_period": lambda _randint=_RNG.randint: "%d" % _randint(10, 1000),
+    "period": lambda _randint=_RNG.randint: "%d" % _randint(1, 3600),
+    "quantity": lambda _randint=_RNG.randint: "%d" % _randint(1, 10),
 }
 
 # Mapping arguments to data types
@@ -1104,7 +1233,6 @@ ARG_TYPE_MAP = {
     "value": "value",
     "element": "element",
     "score": "score",
-    "index": "index",
     "count": "count",
     "cursor": "cursor",
     "increment": "increment",
@@ -1117,7 +1245,6 @@ ARG_TYPE_MAP = {
     "stop": "stop",
     "min": "min",
     "max": "max",
-    "subcommand": "subcommand",
     "section": "section",
     "message": "message",
     "script": "script",
@@ -1134,203 +1261,179 @@ ARG_TYPE_MAP = {
     "destkey": "key",
     "sourcekey": "key",
     "arg": "string",
-    "bit": lambda: random.choice(["0", "1"]),
+    "bit": lambda _choice=_RNG.choice: _choice(_BIT_CHOICES),
     # New data types
-    "categoryname": lambda: random.choice(
-        [
-            "string",
-            "list",
-            "set",
-            "sorted_set",
-            "hash",
-            "pubsub",
-            "transaction",
-            "connection",
-            "server",
-            "scripting",
-        ]
+    "categoryname": lambda _choice=_RNG.choice: _choice(_CATEGORYNAME_CHOICES),
+    "command": lambda _choice=_RNG.choice: _choice(REDIS_COMMAND_NAMES),
+    "bits": lambda _randint=_RNG.randint: "%d" % _randint(1, 256),
+    "rule": lambda _choice=_RNG.choice: _choice(_RULE_CHOICES),
+    "groupname": lambda _chars=random_chars, _p=_GROUP_PREFIX: _p + _chars(LOWER_CHOICES, 3, 8),
+    "consumername": lambda _chars=random_chars, _p=_CONSUMER_PREFIX: (
+        _p + _chars(LOWER_CHOICES, 3, 8)
     ),
-    "command": lambda: random.choice(list(REDIS_COMMANDS.keys())),
-    "bits": lambda: str(random.randint(1, 256)),
-    "rule": lambda: random.choice(
-        [
-            "on",
-            "off",
-            "nopass",
-            "+@all",
-            "-@all",
-            "+@string",
-            "-@dangerous",
-            ">password",
-            "<password",
-        ]
-    ),
-    "groupname": lambda: "group:"
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8))),
-    "consumername": lambda: "consumer:"
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8))),
-    "min-idle-time": lambda: str(random.randint(1, 10000)),
-    "ms-unix-time": lambda: str(random.randint(1000000000, 2000000000)),
-    "last-id": lambda: f"{random.randint(0, 1000)}-{random.randint(0, 1000)}",
-    "weight": lambda: str(random.uniform(0.1, 10.0)),
-    "limit": lambda: str(random.randint(1, 100)),
+    "min-idle-time": lambda _randint=_RNG.randint: "%d" % _randint(1, 10000),
+    "ms-unix-time": lambda _randint=_RNG.randint: "%d" % _randint(1000000000, 2000000000),
+    "last-id": lambda _randint=_RNG.randint: f"{_randint(0, 1000)}-{_randint(0, 1000)}",
+    "weight": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(0.1, 10.0),
+    "limit": lambda _randint=_RNG.randint: "%d" % _randint(1, 100),
     "destination": "key",
     "dst": "key",
     "src": "key",
-    "item": lambda: "item:"
-    + "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(1, 10))
-    ),
-    "error_rate": lambda: str(random.uniform(0.001, 0.1)),
-    "capacity": lambda: str(random.randint(100, 10000)),
-    "expansion": lambda: str(random.randint(1, 5)),
-    "iterator": lambda: str(random.randint(0, 100)),
-    "data": lambda: "".join(
-        random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789")
-        for _ in range(random.randint(10, 50))
-    ),
-    "bucketsize": lambda: str(random.randint(1, 10)),
-    "maxiterations": lambda: str(random.randint(10, 100)),
-    "error": lambda: str(random.uniform(0.01, 0.1)),
-    "probability": lambda: str(random.uniform(0.01, 0.1)),
-    "width": lambda: str(random.randint(10, 100)),
-    "depth": lambda: str(random.randint(5, 20)),
-    "path": lambda: random.choice(["$", "$[0]", "$.field", "$.nested.field", "$..field"]),
-    "indent": lambda: str(random.randint(0, 4)),
-    "newline": lambda: random.choice(["\\n", "\\r\\n"]),
+    "item": lambda _chars=random_chars, _p=_ITEM_PREFIX: _p + _chars(LOWER_ALNUM_CHOICES, 1, 10),
+    "error_rate": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(0.001, 0.1),
+    "capacity": lambda _randint=_RNG.randint: "%d" % _randint(100, 10000),
+    "expansion": lambda _randint=_RNG.randint: "%d" % _randint(1, 5),
+    "iterator": lambda _randint=_RNG.randint: "%d" % _randint(0, 100),
+    "data": lambda _chars=random_chars: _chars(ALPHANUM_CHOICES, 10, 50),
+    "bucketsize": lambda _randint=_RNG.randint: "%d" % _randint(1, 10),
+    "maxiterations": lambda _randint=_RNG.randint: "%d" % _randint(10, 100),
+    "error": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(0.01, 0.1),
+    "probability": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(0.01, 0.1),
+    "width": lambda _randint=_RNG.randint: "%d" % _randint(10, 100),
+    "depth": lambda _randint=_RNG.randint: "%d" % _randint(5, 20),
+    "indent": lambda _randint=_RNG.randint: "%d" % _randint(0, 4),
+    "newline": lambda _choice=_RNG.choice: _choice(_NEWLINE_CHOICES),
     "space": lambda: " ",
-    "number": lambda: str(random.uniform(-100, 100)),
-    "id": lambda: "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(3, 8))
-    ),
+    "number": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(-100, 100),
+    "id": lambda _chars=random_chars: _chars(LOWER_ALNUM_CHOICES, 3, 8),
     "vector": lambda: "["
-    + ",".join(str(random.uniform(-1, 1)) for _ in range(random.randint(2, 10)))
+    + ",".join("%.6g" % _RNG.uniform(-1, 1) for _ in range(_RNG.randint(2, 10)))
     + "]",
-    "dimensions": lambda: str(random.randint(2, 128)),
-    "algorithm": lambda: random.choice(["FLAT", "HNSW"]),
-    "m": lambda: str(random.randint(5, 50)),
-    "ef_construction": lambda: str(random.randint(10, 500)),
-    "distance_metric": lambda: random.choice(["L2", "IP", "COSINE"]),
-    "initial_cap": lambda: str(random.randint(1000, 10000)),
-    "data_type": lambda: random.choice(["FLOAT32", "FLOAT64"]),
-    "ef_runtime": lambda: str(random.randint(10, 1000)),
+    "dimensions": lambda _randint=_RNG.randint: "%d" % _randint(2, 128),
+    "algorithm": lambda _choice=_RNG.choice: _choice(_ALGORITHM_CHOICES),
+    "m": lambda _randint=_RNG.randint: "%d" % _randint(5, 50),
+    "ef_construction": lambda _randint=_RNG.randint: "%d" % _randint(10, 500),
+    "distance_metric": lambda _choice=_RNG.choice: _choice(_DISTANCE_METRIC_CHOICES),
+    "initial_cap": lambda _randint=_RNG.randint: "%d" % _randint(1000, 10000),
+    "data_type": lambda _choice=_RNG.choice: _choice(_DATA_TYPE_CHOICES),
+    "ef_runtime": lambda _randint=_RNG.randint: "%d" % _randint(10, 1000),
     "attributes": lambda: '{"'
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8)))
+    + random_chars(LOWER_CHOICES, 3, 8)
     + '":"'
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8)))
+    + random_chars(LOWER_CHOICES, 3, 8)
     + '"}',
-    "host": lambda: random.choice(["localhost", "127.0.0.1", "redis-server"]),
-    "port": lambda: str(random.randint(1024, 65535)),
-    "numreplicas": lambda: str(random.randint(0, 5)),
-    "numlocal": lambda: str(random.randint(0, 5)),
-    "index1": lambda: str(random.randint(0, 15)),
-    "index2": lambda: str(random.randint(0, 15)),
-    "timeout": lambda: str(random.randint(100, 10000)),
+    "host": lambda _choice=_RNG.choice: _choice(_HOST_CHOICES),
+    "port": lambda _randint=_RNG.randint: "%d" % _randint(1024, 65535),
+    "numreplicas": lambda _randint=_RNG.randint: "%d" % _randint(0, 5),
+    "numlocal": lambda _randint=_RNG.randint: "%d" % _randint(0, 5),
+    "index1": lambda _randint=_RNG.randint: "%d" % _randint(0, 15),
+    "index2": lambda _randint=_RNG.randint: "%d" % _randint(0, 15),
+    "timeout": lambda _randint=_RNG.randint: "%d" % _randint(100, 10000),
     "group": "groupname",
     # New data types
-    "slot": lambda: str(random.randint(0, 16383)),
-    "node-id": lambda: "".join(random.choice("0123456789abcdef") for _ in range(40)),
-    "epoch": lambda: str(random.randint(1, 10000)),
-    "subcommand": lambda: random.choice(["IMPORTING", "MIGRATING", "NODE", "STABLE"]),
-    "cluster-bus-port": lambda: str(random.randint(10000, 30000)),
-    "event": lambda: random.choice(
-        [
-            "command",
-            "fast-command",
-            "fork",
-            "aof-fsync-always",
-            "aof-write",
-            "expire-cycle",
-            "eviction",
-        ]
-    ),
-    "library": lambda: "lib:"
-    + "".join(random.choice(string.ascii_lowercase) for _ in range(random.randint(3, 10))),
+    "slot": lambda _randint=_RNG.randint: "%d" % _randint(0, 16383),
+    "node-id": lambda _randbytes=_RNG.randbytes: _randbytes(20).hex(),
+    "epoch": lambda _randint=_RNG.randint: "%d" % _randint(1, 10000),
+    "subcommand": lambda _choice=_RNG.choice: _choice(_SUBCOMMAND_CHOICES),
+    "cluster-bus-port": lambda _randint=_RNG.randint: "%d" % _randint(10000, 30000),
+    "event": lambda _choice=_RNG.choice: _choice(_EVENT_CHOICES),
+    "library": lambda _chars=random_chars, _p=_LIB_PREFIX: _p + _chars(LOWER_CHOICES, 3, 10),
     "function": lambda: "myfunc",
     "code": lambda: "redis.register_function('myfunc', function() return 'hello' end)",
-    "payload": lambda: "".join(
-        random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")
-        for _ in range(random.randint(20, 100))
-    ),
-    "shardchannel": lambda: "shard:"
-    + "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(3, 8))
-    ),
-    "option": lambda: random.choice(["ACK", "GETACK", "CAPA", "LISTENING-PORT"]),
-    "key1": lambda: "key1:"
-    + "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(1, 10))
-    ),
-    "key2": lambda: "key2:"
-    + "".join(
-        random.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(random.randint(1, 10))
-    ),
-    "len": lambda: str(random.randint(1, 10)),
-    "path": lambda: random.choice(["/path/to/module.so", "./module.so"]),
-    "name": lambda: "".join(
-        random.choice(string.ascii_lowercase) for _ in range(random.randint(3, 10))
-    ),
-    "ip": lambda: ".".join(str(random.randint(0, 255)) for _ in range(4)),
-    "frequency": lambda: str(random.randint(1, 100)),
-    "serialized-value": lambda: "".join(
-        random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")
-        for _ in range(random.randint(20, 100))
+    "payload": lambda: base64.b64encode(_RNG.randbytes(75))[
+        : _RNG.randint(20, 100)
+    ].decode(),
+    "shardchannel": lambda _chars=random_chars, _p=_SHARD_PREFIX: (
+        _p + _chars(LOWER_ALNUM_CHOICES, 3, 8)
     ),
+    "option": lambda _choice=_RNG.choice: _choice(_OPTION_CHOICES),
+    "key1": lambda _chars=random_chars, _p=_KEY1_PREFIX: _p + _chars(LOWER_ALNUM_CHOICES, 1, 10),
+    "key2": lambda _chars=random_chars, _p=_KEY2_PREFIX: _p + _chars(LOWER_ALNUM_CHOICES, 1, 10),
+    "len": lambda _randint=_RNG.randint: "%d" % _randint(1, 10),
+    "path": lambda _choice=_RNG.choice: _choice(_PATH_CHOICES),
+    "name": lambda _chars=random_chars: _chars(LOWER_CHOICES, 3, 10),
+    "ip": lambda _randint=_RNG.randint: ".".join("%d" % _randint(0, 255) for _ in range(4)),
+    "frequency": lambda _randint=_RNG.randint: "%d" % _randint(1, 100),
+    "serialized-value": lambda: base64.b64encode(_RNG.randbytes(75))[
+        : _RNG.randint(20, 100)
+    ].decode(),
     # Rate Limiter parameters
-    "index": lambda: "idx:"
-    + "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(3, 8))),
+    "index": lambda _chars=random_chars, _p=_IDX_PREFIX: _p + _chars(LOWER_CHOICES, 3, 8),
     "filter": lambda: "@field:{tag}",
-    "default_lang": lambda: random.choice(
-        ["english", "spanish", "french", "chinese", "japanese", "arabic"]
-    ),
+    "default_lang": lambda _choice=_RNG.choice: _choice(_DEFAULT_LANG_CHOICES),
     "lang_field": lambda: "language",
-    "default_score": lambda: str(random.uniform(0.1, 10.0)),
+    "default_score": lambda _uniform=_RNG.uniform: "%.6g" % _uniform(0.1, 10.0),
     "score_field": lambda: "score",
-    "stopword": lambda: random.choice(["a", "an", "the", "and", "or", "but", "in", "on", "at"]),
-    "query": lambda: random.choice(["@title:hello", "*", "@tags:{important}", "@num:[0 100]"]),
-    "synonym_group_id": lambda: "group" + str(random.randint(1, 1000)),
-    "term": lambda: random.choice(["word", "term", "phrase", "concept"]),
-    "max_burst": lambda: str(random.randint(0, 30)),
-    "count_per_period": lambda: str(random.randint(10, 1000)),
-    "period": lambda: str(random.randint(1, 3600)),
-    "quantity": lambda: str(random.randint(1, 10)),
+    "stopword": lambda _choice=_RNG.choice: _choice(_STOPWORD_CHOICES),
+    "query": lambda _choice=_RNG.choice: _choice(_QUERY_CHOICES),
+    "synonym_group_id": lambda _randint=_RNG.randint: "group" + "%d" % _randint(1, 1000),
+    "term": lambda _choice=_RNG.choice: _choice(_TERM_CHOICES),
+    "max_burst": lambda _randint=_RNG.randint: "%d" % _randint(0, 30),
+    "count_per_period": lambda _randint=_RNG.randint: "%d" % _randint(10, 1000),
+    "period": lambda _randint=_RNG.randint: "%d" % _randint(1, 3600),
+    "quantity": lambda _randint=_RNG.randint: "%d" % _randint(1, 10),
 }
 
+# Direct argument-name -> generator table.  ARG_TYPE_MAP mixes callables
+# with string aliases into DATA_TYPES; resolving the aliases once here
+# spares hot-path callers the second dict lookup per argument.
+ARG_GENERATORS = {
+    arg: (gen if callable(gen) else DATA_TYPES[gen]) for arg, gen in ARG_TYPE_MAP.items()
+}
+
+
+if __debug__:
+
+    def _check_duplicate_literal_keys():
+        """Guards against re-introducing shadowed duplicate keys in the
+        DATA_TYPES / ARG_TYPE_MAP literals — dict literals dedupe silently,
+        allocating and discarding the earlier entry at import."""
+        import ast
+
+        try:
+            with open(__file__) as f:
+                tree = ast.parse(f.read())
+        except (OSError, ValueError, SyntaxError):
+            return  # e.g. running from a compiled extension module
+        for node in tree.body:
+            if (
+                isinstance(node, ast.Assign)
+                and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id in ("DATA_TYPES", "ARG_TYPE_MAP")
+                and isinstance(node.value, ast.Dict)
+            ):
+                keys = [key.value for key in node.value.keys if isinstance(key, ast.Constant)]
+                duplicates = {key for key in keys if keys.count(key) > 1}
+                assert not duplicates, f"Duplicate keys in {node.targets[0].id}: {duplicates}"
+
+    _check_duplicate_literal_keys()
+
 
 # Enhanced DATA_TYPES with special characters and escaped sequences
+_data_types_enhanced = False
+
+
 def enhance_data_types():
-    global DATA_TYPES
+    global DATA_TYPES, _data_types_enhanced
 
-    # Add functions to generate special characters and escaped strings
-    DATA_TYPES.update(
-        {
-            "special_string": lambda: "".join(
-                random.choice(string.ascii_letters + string.digits + SPECIAL_CHARS)
-                for _ in range(random.randint(1, 20))
-            ),
-            "escaped_string": lambda: random.choice(ESCAPED_CHARS)
-            + "".join(
-                random.choice(string.ascii_letters + string.digits)
-                for _ in range(random.randint(1, 10))
-            ),
-            "mixed_string": lambda: "".join(
-                random.choice(
-                    [
-                        lambda: random.choice(string.ascii_letters + string.digits),
-                        lambda: random.choice(SPECIAL_CHARS),
-                        lambda: random.choice(ESCAPED_CHARS),
-                    ]
-                )()
-                for _ in range(random.randint(5, 20))
-            ),
-            "binary_string": lambda: "\\x"
-            + "".join(format(random.randint(0, 255), "02x") for _ in range(random.randint(1, 10))),
-        }
-    )
+    # Calling twice would stack special_special_* variants on top of the
+    # first batch; every consumer shares one enhancement pass instead.
+    if _data_types_enhanced:
+        return
+    _data_types_enhanced = True
+
+    # Functions to generate special characters and escaped strings.  The
+    # pools and random helpers ride along as default arguments so each
+    # call reads fast locals instead of module globals.
+    enhanced_types = {
+        "special_string": lambda _chars=random_chars: _chars(ALPHANUM_SPECIAL_CHOICES, 1, 20),
+        "escaped_string": lambda _choice=_RNG.choice, _chars=random_chars, _esc=ESCAPED_CHARS: (
+            _choice(_esc) + _chars(ALPHANUM_CHOICES, 1, 10)
+        ),
+        # Each character picks one of the three pools, then one element of
+        # it — two choice() calls, no per-character lambda allocation.
+        "mixed_string": lambda _choice=_RNG.choice, _randint=_RNG.randint: "".join(
+            _choice(_choice(_MIXED_POOLS)) for _ in range(_randint(5, 20))
+        ),
+        "binary_string": lambda _randbytes=_RNG.randbytes, _randint=_RNG.randint: (
+            "\\x" + _randbytes(_randint(1, 10)).hex()
+        ),
+    }
 
-    # Create enhanced versions of existing types
-    enhanced_types = {}
-    for key, func in DATA_TYPES.items():
+    # Create enhanced versions of existing types.  The base generator is
+    # captured directly rather than re-resolved through DATA_TYPES on
+    # every call, and the whole batch lands in one final update.
+    for key, base in {**DATA_TYPES, **enhanced_types}.items():
         if key.endswith("string") or key in [
             "value",
             "message",
@@ -1340,31 +1443,41 @@ def enhance_data_types():
             "member",
             "pattern",
         ]:
-            enhanced_types[f"special_{key}"] = lambda k=key: DATA_TYPES[k]() + random.choice(
-                SPECIAL_CHARS
+            enhanced_types[f"special_{key}"] = (
+                lambda base=base, _choice=_RNG.choice, _pool=SPECIAL_CHARS_CHOICES: (
+                    base() + _choice(_pool)
+                )
             )
-            enhanced_types[f"escaped_{key}"] = lambda k=key: DATA_TYPES[k]() + random.choice(
-                ESCAPED_CHARS
+            enhanced_types[f"escaped_{key}"] = (
+                lambda base=base, _choice=_RNG.choice, _pool=ESCAPED_CHARS: (
+                    base() + _choice(_pool)
+                )
             )
 
     DATA_TYPES.update(enhanced_types)
 
 
 # Function to load previous input cases as dictionary values
+# The input corpus is static for the duration of a fuzz run, so cache the
+# parsed result; repeat callers get a dict fetch instead of listdir + reads.
+# Call load_input_dict.cache_clear() if the corpus changes underneath us.
+@functools.lru_cache(maxsize=1)
 def load_input_dict():
     """Load all input files as dictionary values"""
     input_values = []
     if os.path.exists(INPUT_DIR):
         for filename in os.listdir(INPUT_DIR):
-            if filename.endswith(".txt"):
+            if filename.endswith(b".txt"):
                 try:
+                    # One read + C-level splitlines instead of the line
+                    # iterator protocol; partition() returns a 3-tuple
+                    # unconditionally, sparing the split-list length check.
                     with open(os.path.join(INPUT_DIR, filename), "r") as f:
-                        for line in f:
-                            line = line.strip()
-                            if line:
-                                parts = line.split(" ", 1)
-                                if len(parts) > 1:
-                                    input_values.append(parts[1])
+                        lines = f.read().splitlines()
+                    for line in lines:
+                        head, sep, tail = line.strip().partition(" ")
+                        if sep:
+                            input_values.append(tail)
                 except Exception as e:
-                    print(f"Error loading input file {filename}: {e}")
+                    print(f"Error loading input file {os.fsdecode(filename)}: {e}")
     return input_values
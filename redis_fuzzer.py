@@ -1,20 +1,57 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import asyncio
 import random
 import socket
 import sys
 import os
 import json
 import signal
+import stat
 import argparse
+import array
+import gc
+import mmap
 import subprocess
+
+# Optional C-level RESP parser.  The harness stays dependency-free; when
+# hiredis happens to be installed the client parses replies with it and
+# otherwise falls back to the pure-Python decode_resp.
+try:
+    import hiredis
+except ImportError:
+    hiredis = None
+
+# Optional fast JSON serializer for test-case save/load.  orjson emits
+# bytes directly and is several times faster than the stdlib module on
+# the large commands/results structures a fuzz run accumulates.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional AFL persistent-mode bindings (python-afl, run via py-afl-fuzz).
+# With them one interpreter handles thousands of inputs in a loop, paying
+# the import and connect cost once instead of per execution; without them
+# the harness keeps the classic one-process-per-input behavior.
+try:
+    import afl
+except ImportError:
+    afl = None
+
 from redis_commands import (
     REDIS_HOST,
     REDIS_PORT,
     REDIS_COMMANDS,
+    REDIS_COMMAND_NAMES,
+    COMMAND_IDS,
+    COMMAND_SPECS_BY_ID,
+    OPT_ALTERNATIVES,
+    OPT_PAIR,
     DATA_TYPES,
     ARG_TYPE_MAP,
+    ARG_GENERATORS,
     DICT_MIX_RATIO,
     DICT_FILE,
     load_input_dict,
@@ -29,41 +66,134 @@ MAX_PARALLEL_TESTS = 10  # Maximum number of parallel tests
 MAX_COMMAND_LEN = 1024  # Maximum command length
 TIMEOUT_SECONDS = 5  # Timeout for command execution
 
-# Load input values
-INPUT_VALUES = load_input_dict()
+# Hot-command biasing
+HOT_COMMANDS_SIZE = 32  # Number of commands kept in the hot table
+HOT_COMMANDS_PROBABILITY = 0.8  # Probability of sampling from the hot table
+HOT_REBUILD_INTERVAL = 128  # Observations between hot-table rebuilds
+
+# Per-command progress prints cost a write() syscall each and serialize
+# the inner loop to log I/O under afl-fuzz.  They stay available for
+# debugging a run by hand but are off by default; errors and the final
+# summary are always printed.
+_DEBUG = os.environ.get("FUZZ_DEBUG") == "1"
+
+# Load input values (frozen as a tuple: O(1) indexing, no accidental growth)
+INPUT_VALUES = tuple(load_input_dict())
+
+
+class DictionaryValues:
+    """Read-only view of the AFL++ dictionary file backed by mmap.
+
+    The file is mapped once and indexed by an array of line offsets, so
+    entries live in the page cache (shared copy-on-write across AFL forks)
+    instead of being materialized as a Python list of strings.  Entries
+    are decoded lazily when sampled."""
+
+    def __init__(self, path):
+        self._mmap = None
+        self._offsets = array.array("Q")
+        try:
+            with open(path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
+        except (OSError, ValueError) as e:
+            print(f"Error loading dictionary file: {e}")
+            return
+
+        data = self._mmap
+        size = len(data)
+        pos = 0
+        while pos < size:
+            newline = data.find(b"\n", pos)
+            if newline < 0:
+                newline = size
+            start, end = pos, newline
+            # Strip surrounding whitespace and index only quoted entries
+            while start < end and data[start] in b" \t\r":
+                start += 1
+            while end > start and data[end - 1] in b" \t\r":
+                end -= 1
+            if end - start >= 2 and data[start] == ord('"') and data[end - 1] == ord('"'):
+                self._offsets.append(start + 1)
+                self._offsets.append(end - 1)
+            pos = newline + 1
+
+    def __len__(self):
+        return len(self._offsets) // 2
+
+    def __getitem__(self, index):
+        start = self._offsets[2 * index]
+        end = self._offsets[2 * index + 1]
+        return self._mmap[start:end].decode("utf-8", errors="ignore")
+
+
+def load_dict_values(path=DICT_FILE):
+    """Loads AFL++ dictionary values as an mmap-backed view if the file exists"""
+    if os.path.exists(path):
+        return DictionaryValues(path)
+    return []
+
 
 # Load dictionary values if exists
-DICT_VALUES = []
-if os.path.exists(DICT_FILE):
-    try:
-        with open(DICT_FILE, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and line.startswith('"') and line.endswith('"'):
-                    DICT_VALUES.append(line[1:-1])
-    except Exception as e:
-        print(f"Error loading dictionary file: {e}")
+DICT_VALUES = load_dict_values()
 
 # Initialize enhanced data types
 enhance_data_types()
 
+# Command-selection pools, filtered once at import instead of rebuilding
+# the comprehensions on every draw.  If exclusion removes everything,
+# fall back to the full list so selection never samples an empty pool.
+_AVAILABLE_COMMANDS = (
+    tuple(cmd for cmd in REDIS_COMMAND_NAMES if cmd not in EXCLUDED_COMMANDS)
+    or REDIS_COMMAND_NAMES
+)
+_FOCUS_CANDIDATES = tuple(cmd for cmd in FOCUS_COMMANDS if cmd not in EXCLUDED_COMMANDS)
+# Single focus command: 30% probability (original behavior)
+# Multiple commands: 50% probability for any of the focus commands
+_FOCUS_PROBABILITY = 0.30 if len(_FOCUS_CANDIDATES) == 1 else 0.50
+
 
 # Functions for working with Redis RESP protocol
-def encode_resp(data):
-    """Encodes Python data to RESP format"""
-    if isinstance(data, str):
-        return f"${len(data)}\r\n{data}\r\n"
-    elif isinstance(data, int):
-        return f":{data}\r\n"
-    elif isinstance(data, list):
-        resp = f"*{len(data)}\r\n"
-        for item in data:
-            resp += encode_resp(item)
-        return resp
-    elif data is None:
-        return "$-1\r\n"
-    else:
-        return f"+{data}\r\n"
+def _resp_bulk(data):
+    """Frames one value as a RESP bulk string"""
+    if not isinstance(data, bytes):
+        data = str(data).encode("utf-8", errors="ignore")
+    return b"$%d\r\n%s\r\n" % (len(data), data)
+
+
+# Bulk-string framing for the constant command tokens, computed once at
+# import so the send path reuses prebuilt b"$3\r\nSET\r\n"-style pieces.
+_RESP_COMMAND_FRAMES = {name: _resp_bulk(name) for name in REDIS_COMMAND_NAMES}
+
+
+# Reusable scratch buffer for RESP assembly.  Slice assignment grows the
+# bytearray on demand and the capacity persists across calls, so encoding
+# neither accumulates a fragment list nor reallocates per command.
+_RESP_SCRATCH = bytearray(65536)
+
+
+def resp_encode_command(command, args):
+    """Encodes one command invocation as a binary RESP array of bulk strings.
+
+    The command token's framing comes from the precomputed table; the full
+    message is written into the persistent scratch buffer and copied out
+    once, avoiding the per-piece str concatenation of encode_resp."""
+    scratch = _RESP_SCRATCH
+    frame = _RESP_COMMAND_FRAMES.get(command)
+    if frame is None:
+        frame = _resp_bulk(command)
+    header = b"*%d\r\n" % (len(args) + 1)
+
+    pos = len(header)
+    scratch[:pos] = header
+    end = pos + len(frame)
+    scratch[pos:end] = frame
+    pos = end
+    for arg in args:
+        piece = _resp_bulk(arg)
+        end = pos + len(piece)
+        scratch[pos:end] = piece
+        pos = end
+    return bytes(memoryview(scratch)[:pos])
 
 
 def decode_resp(data):
@@ -71,7 +201,7 @@ def decode_resp(data):
     if not data:
         return None
 
-    data_type = data[0]
+    data_type = data[0:1]
     if data_type == b"+":  # Simple String
         return data[1:].split(b"\r\n")[0].decode("utf-8", errors="ignore")
     elif data_type == b"-":  # Error
@@ -137,6 +267,40 @@ def decode_resp(data):
         return data.decode("utf-8", errors="ignore")
 
 
+def _reply_end(data, pos):
+    """Returns the offset one past the RESP reply starting at pos.
+
+    Returns -1 while the reply is still incomplete; raises ValueError on
+    bytes that are not a RESP frame. Used to split pipelined replies when
+    the hiredis reader is not available.
+    """
+    if pos >= len(data):
+        return -1
+    newline = data.find(b"\r\n", pos)
+    if newline < 0:
+        return -1
+    data_type = data[pos : pos + 1]
+    if data_type in (b"+", b"-", b":"):
+        return newline + 2
+    if data_type == b"$":
+        length = int(data[pos + 1 : newline])
+        if length == -1:
+            return newline + 2
+        end = newline + 2 + length + 2
+        return end if len(data) >= end else -1
+    if data_type == b"*":
+        length = int(data[pos + 1 : newline])
+        if length == -1:
+            return newline + 2
+        end = newline + 2
+        for _ in range(length):
+            end = _reply_end(data, end)
+            if end < 0:
+                return -1
+        return end
+    raise ValueError(f"Unknown RESP type byte: {data_type!r}")
+
+
 class RedisClient:
     """Class for interacting with Redis server"""
 
@@ -145,7 +309,11 @@ class RedisClient:
         self.port = port
         self.timeout = timeout
         self.sock = None
-        print(f"Initializing connection to Redis at {self.host}:{self.port}")
+        # C-level incremental RESP parser when hiredis is installed;
+        # None selects the pure-Python decode_resp fallback.
+        self.reader = hiredis.Reader(encoding="utf-8", errors="ignore") if hiredis else None
+        if _DEBUG:
+            print(f"Initializing connection to Redis at {self.host}:{self.port}")
         self.connect()
 
     def connect(self):
@@ -153,8 +321,14 @@ class RedisClient:
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.sock.settimeout(self.timeout)
+            # Batched pipeline writes should hit the wire immediately
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Large send buffer so a whole pipelined batch queues in the
+            # kernel without blocking on the default window
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
             self.sock.connect((self.host, self.port))
-            print(f"Successfully connected to Redis at {self.host}:{self.port}")
+            if _DEBUG:
+                print(f"Successfully connected to Redis at {self.host}:{self.port}")
             return True
         except (socket.error, socket.timeout) as e:
             print(f"Connection error to Redis at {self.host}:{self.port}: {e}")
@@ -176,132 +350,362 @@ class RedisClient:
 
         try:
             # Forming RESP command
-            cmd_parts = [command] + list(args)
-            resp_command = encode_resp(cmd_parts)
+            resp_command = resp_encode_command(command, args)
 
             # Sending command
-            self.sock.sendall(resp_command.encode("utf-8"))
+            self.sock.sendall(resp_command)
 
             # Receiving response
-            data = b""
+            if self.reader is not None:
+                # Feed socket chunks into hiredis until a full reply parses
+                while True:
+                    reply = self.reader.gets()
+                    if reply is not False:
+                        if isinstance(reply, hiredis.ReplyError):
+                            return {"error": str(reply)}
+                        return reply
+                    chunk = self.sock.recv(65536)
+                    if not chunk:
+                        return None
+                    self.reader.feed(chunk)
+
+            # Length-aware fallback: accumulate into a bytearray (linear,
+            # no bytes-concat copies) until one whole RESP reply framed by
+            # _reply_end has arrived, instead of stopping at the first CRLF
+            data = bytearray()
             while True:
-                chunk = self.sock.recv(4096)
+                chunk = self.sock.recv(65536)
                 if not chunk:
                     break
-                data += chunk
-                if b"\r\n" in data:  # Checking if we received full response
-                    break
+                data.extend(chunk)
+                try:
+                    end = _reply_end(data, 0)
+                except ValueError:
+                    break  # Not RESP framing; decode whatever arrived
+                if end >= 0:
+                    return decode_resp(bytes(data[:end]))
 
             # Decoding response
-            return decode_resp(data)
+            return decode_resp(bytes(data))
         except (socket.error, socket.timeout) as e:
             return {"error": f"Command execution error: {e}"}
         except Exception as e:
             return {"error": f"Unknown error: {e}"}
 
+    def _send_frames(self, frames):
+        """Writes a list of encoded command frames with one sendmsg.
+
+        The kernel gathers the iovec directly, so the per-command frames
+        are never concatenated into a contiguous buffer in user space.
+        Short sends advance an (index, offset) cursor into the list."""
+        index = 0
+        offset = 0
+        while index < len(frames):
+            head = memoryview(frames[index])[offset:] if offset else frames[index]
+            sent = self.sock.sendmsg([head, *frames[index + 1 :]])
+            offset += sent
+            while index < len(frames) and offset >= len(frames[index]):
+                offset -= len(frames[index])
+                index += 1
+
+    def pipeline(self, commands):
+        """Sends all (command, args) pairs in one batch and reads the replies.
+
+        Classic RESP pipelining: one scatter-gather send for the whole
+        batch, then the matching number of replies parsed back in order,
+        so a test case costs roughly one round trip instead of one per
+        command. Transport errors fill the remaining slots with the usual
+        error dict shape.
+        """
+        if not self.sock and not self.connect():
+            error = {"error": f"No connection to Redis at {self.host}:{self.port}"}
+            return [error] * len(commands)
+
+        frames = [resp_encode_command(command, args) for command, args in commands]
+
+        replies = []
+        try:
+            self._send_frames(frames)
+            if self.reader is not None:
+                while len(replies) < len(commands):
+                    reply = self.reader.gets()
+                    if reply is not False:
+                        if isinstance(reply, hiredis.ReplyError):
+                            reply = {"error": str(reply)}
+                        replies.append(reply)
+                        continue
+                    chunk = self.sock.recv(65536)
+                    if not chunk:
+                        break
+                    self.reader.feed(chunk)
+            else:
+                data = b""
+                pos = 0
+                while len(replies) < len(commands):
+                    end = _reply_end(data, pos)
+                    if end >= 0:
+                        replies.append(decode_resp(data[pos:end]))
+                        pos = end
+                        continue
+                    chunk = self.sock.recv(65536)
+                    if not chunk:
+                        break
+                    data += chunk
+        except (socket.error, socket.timeout) as e:
+            error = {"error": f"Command execution error: {e}"}
+            replies.extend([error] * (len(commands) - len(replies)))
+        except Exception as e:
+            error = {"error": f"Unknown error: {e}"}
+            replies.extend([error] * (len(commands) - len(replies)))
+
+        # Server closed the stream early: mark whatever got no reply
+        missing = {"error": "Connection closed before reply"}
+        replies.extend([missing] * (len(commands) - len(replies)))
+        return replies
+
+
+# Long-lived client shared across AFL iterations.  afl-fuzz invokes the
+# harness repeatedly, and a fresh RedisClient per run pays a TCP
+# three-way handshake every time; one warm socket amortizes that away.
+_persistent_client = None
+
+
+def _get_client():
+    """Returns the shared RedisClient, reconnecting only when it died.
+
+    On reuse a RESET is sent first so connection state left behind by a
+    previous iteration's commands (MULTI, subscribe mode, ...) is cleared
+    for one round trip instead of a full reconnect.
+    """
+    global _persistent_client
+    client = _persistent_client
+    if client is None or client.sock is None:
+        _persistent_client = client = RedisClient()
+        return client
+
+    reply = client.execute_command("RESET")
+    # A dead socket surfaces as None (peer closed) or a transport error
+    # dict; a server-side -ERR still proves the link is alive.
+    if reply is None or (
+        isinstance(reply, dict) and "Command execution error" in reply.get("error", "")
+    ):
+        client.close()
+        _persistent_client = client = RedisClient()
+    return client
+
 
 class RedisCommandGenerator:
     """Class for generating random Redis commands"""
 
     @staticmethod
-    def get_value_from_dictionary(arg_type):
+    def get_value_from_dictionary(arg_type, _random=random.random, _choice=random.choice):
         """Gets a value from dictionary or input values if available"""
         # Random choice between input values and dictionary values
-        if INPUT_VALUES and random.random() < 0.5:
-            return random.choice(INPUT_VALUES)
+        if INPUT_VALUES and _random() < 0.5:
+            return _choice(INPUT_VALUES)
         elif DICT_VALUES:
-            return random.choice(DICT_VALUES)
+            return _choice(DICT_VALUES)
         return None
 
     @staticmethod
-    def generate_random_arg(arg_type):
-        """Generates a random argument of a given type with mixed sources"""
-        # Try to get value from dictionary based on mix ratio
-        if random.random() < DICT_MIX_RATIO:
-            dict_value = RedisCommandGenerator.get_value_from_dictionary(arg_type)
-            if dict_value:
-                return dict_value
-
-        # If no dictionary value or ratio check failed, generate a value
+    def make_arg_builder(arg_type):
+        """Specializes the argument-type dispatch for a single token.
+
+        The type dispatch (callable check, ARG_TYPE_MAP lookup, variant
+        availability) is resolved once here at import time; the returned
+        closure only performs the residual per-call random draws."""
+        get_dict_value = RedisCommandGenerator.get_value_from_dictionary
+
         if callable(arg_type):
-            return arg_type()
+            generate = arg_type
         elif arg_type in ARG_TYPE_MAP:
             type_name = ARG_TYPE_MAP[arg_type]
             if callable(type_name):
-                return type_name()
-
-            # Decide if we should use a special variant
-            variant_decision = random.random()
-            if variant_decision < 0.2 and f"special_{type_name}" in DATA_TYPES:
-                return DATA_TYPES[f"special_{type_name}"]()
-            elif variant_decision < 0.4 and f"escaped_{type_name}" in DATA_TYPES:
-                return DATA_TYPES[f"escaped_{type_name}"]()
-            elif variant_decision < 0.6 and type_name in ["string", "value", "message", "element"]:
-                return DATA_TYPES["mixed_string"]()
-            elif variant_decision < 0.8 and type_name in ["string", "value", "message", "element"]:
-                return DATA_TYPES["binary_string"]()
+                generate = type_name
             else:
-                return DATA_TYPES[type_name]()
+                base = ARG_GENERATORS[arg_type]
+                special = DATA_TYPES.get(f"special_{type_name}")
+                escaped = DATA_TYPES.get(f"escaped_{type_name}")
+                textual = type_name in ("string", "value", "message", "element")
+                mixed = DATA_TYPES["mixed_string"]
+                binary = DATA_TYPES["binary_string"]
+
+                def generate():
+                    variant_decision = random.random()
+                    if variant_decision < 0.2 and special is not None:
+                        return special()
+                    elif variant_decision < 0.4 and escaped is not None:
+                        return escaped()
+                    elif variant_decision < 0.6 and textual:
+                        return mixed()
+                    elif variant_decision < 0.8 and textual:
+                        return binary()
+                    return base()
+
+        else:
 
-        return arg_type  # Returns as is if type not found
+            def generate():
+                return arg_type  # Returns as is if type not found
+
+        def build(_random=random.random):
+            # Try to get value from dictionary based on mix ratio
+            if _random() < DICT_MIX_RATIO:
+                dict_value = get_dict_value(arg_type)
+                if dict_value:
+                    return dict_value
+            return generate()
+
+        return build
 
     @staticmethod
-    def generate_random_command():
-        """Generates a random Redis command with arguments"""
-        # Prepare candidate command lists excluding the excluded commands
-        available_commands = [cmd for cmd in REDIS_COMMANDS.keys() if cmd not in EXCLUDED_COMMANDS]
-
-        # Sanity check: if everything is excluded, fallback to full list to avoid empty
-        if not available_commands:
-            available_commands = list(REDIS_COMMANDS.keys())
-
-        # Prepare focus commands that are not excluded
-        focus_candidates = [cmd for cmd in FOCUS_COMMANDS if cmd not in EXCLUDED_COMMANDS]
-
-        # Handle focus commands based on their count
-        if focus_candidates:
-            if len(focus_candidates) == 1:
-                # Single command: 30% probability (original behavior)
-                if random.random() < 0.30:
-                    command = focus_candidates[0]
-                else:
-                    command = random.choice(available_commands)
-            else:
-                # Multiple commands: 50% probability for any of the focus commands
-                if random.random() < 0.50:
-                    command = random.choice(focus_candidates)
-                else:
-                    command = random.choice(available_commands)
-        else:
-            command = random.choice(available_commands)
+    def choose_command_names(num_commands):
+        """Draws a batch of command names honoring exclusion and focus rules.
+
+        The non-focus names are drawn with a single bulk random.choices
+        call over the pools precomputed at import; focus commands then
+        override individual slots with the same probabilities
+        generate_random_command always used."""
+        names = random.choices(_AVAILABLE_COMMANDS, k=num_commands)
+
+        # Bias toward commands with recent useful feedback, if any
+        if _HOT_COMMANDS:
+            for i in range(num_commands):
+                if random.random() < HOT_COMMANDS_PROBABILITY:
+                    names[i] = random.choice(_HOT_COMMANDS)
+
+        if _FOCUS_CANDIDATES:
+            for i in range(num_commands):
+                if random.random() < _FOCUS_PROBABILITY:
+                    names[i] = random.choice(_FOCUS_CANDIDATES)
 
-        command_info = REDIS_COMMANDS[command]
+        return names
 
-        args = []
-        for arg in command_info["args"]:
-            args.append(RedisCommandGenerator.generate_random_arg(arg))
+    @staticmethod
+    def build_command(
+        command,
+        _random=random.random,
+        _randint=random.randint,
+        _sample=random.sample,
+        _choice=random.choice,
+    ):
+        """Materializes one (command, args) pair from the precompiled tables.
+
+        The random helpers ride along as default arguments: the optional-
+        args block draws several times per command, and LOAD_FAST beats a
+        module attribute walk on each of those draws."""
+        command_id = COMMAND_IDS[command]
+        builders = _ARG_BUILDERS_BY_ID[command_id]
+        if builders is None:
+            builders = _compile_command_builders(command_id)
+        optional_args = _OPTIONAL_SPECS_BY_ID[command_id]
+
+        args = [builder() for builder in builders]
 
         # Adds random optional arguments
         if (
-            command_info["optional_args"] and random.random() < 0.7
+            optional_args and _random() < 0.7
         ):  # Increased probability to include optional args
-            for opt_arg in random.sample(
-                command_info["optional_args"], random.randint(0, len(command_info["optional_args"]))
+            for kind, payload, repeatable in _sample(
+                optional_args, _randint(0, len(optional_args))
             ):
-                if " " in opt_arg:  # If argument consists of multiple parts
-                    opt_parts = opt_arg.split(" ")
-                    if "|" in opt_parts[0]:  # If it's a choice between multiple options
-                        choices = opt_parts[0].split("|")
-                        args.append(random.choice(choices))
+                for _ in range(_randint(1, 3) if repeatable else 1):
+                    if kind == OPT_ALTERNATIVES:  # Choice between multiple options
+                        args.append(_choice(payload))
+                    elif kind == OPT_PAIR:  # Keyword followed by a prebuilt value builder
+                        keyword, value_builder = payload
+                        args.append(keyword)
+                        args.append(value_builder())
                     else:
-                        args.append(opt_parts[0])
-                        if len(opt_parts) > 1:
-                            args.append(RedisCommandGenerator.generate_random_arg(opt_parts[1]))
-                else:
-                    args.append(opt_arg)
+                        args.append(payload)
 
         return command, args
 
+    @staticmethod
+    def generate_batch(num_commands):
+        """Generates a batch of random commands with one bulk name draw"""
+        build = RedisCommandGenerator.build_command
+        return [build(name) for name in RedisCommandGenerator.choose_command_names(num_commands)]
+
+    @staticmethod
+    def generate_random_command():
+        """Generates a random Redis command with arguments"""
+        return RedisCommandGenerator.build_command(
+            RedisCommandGenerator.choose_command_names(1)[0]
+        )
+
+
+# Per-command argument builders indexed by command id.  The token-type
+# dispatch is partially evaluated by make_arg_builder, but only on the
+# first time a command is actually generated: an AFL-driven process that
+# emits a couple of dozen commands then never pays for specializing the
+# other few hundred entries at startup.
+_ARG_BUILDERS_BY_ID = [None] * len(COMMAND_SPECS_BY_ID)
+_OPTIONAL_SPECS_BY_ID = [None] * len(COMMAND_SPECS_BY_ID)
+
+
+def _compile_command_builders(command_id):
+    """Specializes and memoizes one command's builders on first use.
+
+    Fills the required-argument builder tuple and rewrites the optional
+    specs so each "KEYWORD value" pair carries a prebuilt value builder
+    instead of re-running the argument-type dispatch per call.
+    """
+    make_builder = RedisCommandGenerator.make_arg_builder
+    required_args, optional_args = COMMAND_SPECS_BY_ID[command_id]
+    builders = tuple(make_builder(arg) for arg in required_args)
+    _ARG_BUILDERS_BY_ID[command_id] = builders
+    _OPTIONAL_SPECS_BY_ID[command_id] = tuple(
+        (
+            kind,
+            (payload[0], make_builder(payload[1])) if kind == OPT_PAIR else payload,
+            repeatable,
+        )
+        for kind, payload, repeatable in optional_args
+    )
+    return builders
+
+# The import-time tables are built by now (lazily-compiled builders land
+# later, in whichever process first needs them); move everything live into
+# GC's permanent generation so AFL forkserver children inherit the pages
+# read-mostly instead of COW-duplicating them on the first collection.
+gc.freeze()
+
+# Per-command feedback counters, indexed by command id.  Commands that
+# recently drew useful server replies are promoted into a small hot table
+# that command selection samples preferentially, biasing the fuzz stream
+# toward the grammar subset the server actually accepts.
+_command_counters = array.array("Q", bytes(8 * len(REDIS_COMMAND_NAMES)))
+_commands_observed = 0
+_HOT_COMMANDS = ()
+
+
+def record_command_feedback(command):
+    """Credits a command whose execution produced a non-error reply and
+    periodically rebuilds the hot-command table from the counters"""
+    global _commands_observed, _HOT_COMMANDS
+
+    command_id = COMMAND_IDS.get(command)
+    if command_id is None:
+        return
+    _command_counters[command_id] += 1
+    _commands_observed += 1
+
+    if _commands_observed % HOT_REBUILD_INTERVAL == 0:
+        ranked = sorted(
+            range(len(_command_counters)), key=_command_counters.__getitem__, reverse=True
+        )
+        _HOT_COMMANDS = tuple(
+            REDIS_COMMAND_NAMES[i]
+            for i in ranked[:HOT_COMMANDS_SIZE]
+            if _command_counters[i] and REDIS_COMMAND_NAMES[i] not in EXCLUDED_COMMANDS
+        )
+
+
+# Forkserver children clone the parent's Mersenne Twister state; reseed
+# after fork (from OS entropy) so each child draws a divergent command
+# stream unless an explicit per-test seed overrides it.
+os.register_at_fork(after_in_child=random.seed)
+
 
 class TestCase:
     """Class for creating and executing test cases"""
@@ -318,40 +722,42 @@ class TestCase:
         if num_commands is None:
             num_commands = random.randint(1, MAX_COMMANDS_PER_TEST)
 
-        generated_commands = []
-        for _ in range(num_commands):
-            command, args = RedisCommandGenerator.generate_random_command()
-            generated_commands.append((command, args))
-
-        self.commands = generated_commands
+        self.commands = RedisCommandGenerator.generate_batch(num_commands)
         return self.commands
 
     def execute_test_case(self):
-        """Executes a test case on Redis server"""
-        self.redis_client = RedisClient()
-        self.results = []
-
-        for command, args in self.commands:
-            try:
-                result = self.redis_client.execute_command(command, *args)
-                self.results.append({"command": command, "args": args, "result": result})
-            except Exception as e:
-                self.results.append({"command": command, "args": args, "error": str(e)})
+        """Executes a test case on Redis server as one pipelined batch"""
+        # The shared client stays open for the next iteration
+        self.redis_client = _get_client()
+        self.results = [
+            {"command": command, "args": args, "result": result}
+            for (command, args), result in zip(
+                self.commands, self.redis_client.pipeline(self.commands)
+            )
+        ]
 
-        self.redis_client.close()
         return self.results
 
     def save_to_file(self, filename):
         """Saves a test case to file"""
-        with open(filename, "w", encoding="utf-8") as f:
-            data = {"commands": self.commands, "results": self.results}
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        data = {"commands": self.commands, "results": self.results}
+        if orjson is not None:
+            # orjson serializes straight to utf-8 bytes in one pass
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
 
     @staticmethod
     def load_from_file(filename):
         """Loads a test case from file"""
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(filename, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
 
         test_case = TestCase()
         test_case.commands = data["commands"]
@@ -375,7 +781,8 @@ class AFLFuzzer:
             "timeouts": 0,
         }
 
-        print(f"AFLFuzzer initialized with target: {REDIS_HOST}:{REDIS_PORT}")
+        if _DEBUG:
+            print(f"AFLFuzzer initialized with target: {REDIS_HOST}:{REDIS_PORT}")
 
     def handle_sigterm(self, signum, frame):
         """Handling SIGTERM signal from AFL++"""
@@ -388,8 +795,23 @@ class AFLFuzzer:
     def read_afl_input(self):
         """Reads input data from AFL++"""
         try:
-            self.afl_input = sys.stdin.buffer.read()
-            print(f"Read {len(self.afl_input)} bytes from AFL++ input")
+            # Read fd 0 directly: afl-fuzz hands the input over a
+            # file-backed stdin, so one os.read of st_size grabs the
+            # whole blob without the BufferedReader layer and its copy
+            st = os.fstat(0)
+            if stat.S_ISREG(st.st_mode):
+                self.afl_input = os.read(0, st.st_size)
+            else:
+                # Piped stdin: drain until EOF
+                chunks = []
+                while True:
+                    chunk = os.read(0, 1 << 20)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                self.afl_input = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+            if _DEBUG:
+                print(f"Read {len(self.afl_input)} bytes from AFL++ input")
             return True
         except Exception as e:
             print(f"Error reading input data from AFL++: {e}")
@@ -402,27 +824,27 @@ class AFLFuzzer:
             return False
 
         try:
-            # Splitting input data into lines
-            lines = self.afl_input.split(b"\n")
+            # Decode the whole input once and split at C level; partition
+            # peels off the command token without building a word list for
+            # lines that fail the command check anyway
+            text = self.afl_input.decode("utf-8", errors="ignore")
             parsed_commands = []
+            known_commands = REDIS_COMMANDS
+            excluded = EXCLUDED_COMMANDS
 
-            for line in lines:
+            for line in text.split("\n"):
                 if not line:
                     continue
 
-                # Parsing command and arguments
-                parts = line.decode("utf-8", errors="ignore").strip().split(" ")
-                if not parts:
-                    continue
-
-                command = parts[0].upper()
-                args = parts[1:] if len(parts) > 1 else []
+                command, _, rest = line.strip().partition(" ")
+                command = command.upper()
 
                 # Checking if command exists and is not excluded
-                if command in REDIS_COMMANDS and command not in EXCLUDED_COMMANDS:
-                    parsed_commands.append((command, args))
+                if command in known_commands and command not in excluded:
+                    parsed_commands.append((command, rest.split(" ") if rest else []))
 
-            print(f"Parsed {len(parsed_commands)} commands from input")
+            if _DEBUG:
+                print(f"Parsed {len(parsed_commands)} commands from input")
 
             # Always generate a mix of parsed and random commands
             test_case_seed = (
@@ -442,9 +864,9 @@ class AFLFuzzer:
                 self.test_cases = random.sample(parsed_commands, num_parsed)
 
                 # Add random commands to reach the desired number
-                while len(self.test_cases) < num_commands:
-                    command, args = RedisCommandGenerator.generate_random_command()
-                    self.test_cases.append((command, args))
+                self.test_cases.extend(
+                    RedisCommandGenerator.generate_batch(num_commands - len(self.test_cases))
+                )
             else:
                 # If no parsed commands, generate all random ones
                 self.test_cases = test_case.generate_test_case(num_commands)
@@ -452,7 +874,8 @@ class AFLFuzzer:
             # Shuffle the commands
             random.shuffle(self.test_cases)
 
-            print(f"Generated {len(self.test_cases)} total commands for testing")
+            if _DEBUG:
+                print(f"Generated {len(self.test_cases)} total commands for testing")
             return True
         except Exception as e:
             print(f"Error parsing input data from AFL++: {e}")
@@ -462,10 +885,66 @@ class AFLFuzzer:
             print(f"Falling back to {len(self.test_cases)} random commands")
             return True
 
+    async def _pipeline_async(self, commands):
+        """Pipelines one slice of the test case over its own connection"""
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(REDIS_HOST, REDIS_PORT), TIMEOUT_SECONDS
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            error = {"error": f"No connection to Redis at {REDIS_HOST}:{REDIS_PORT}: {e}"}
+            return [error] * len(commands)
+
+        buf = bytearray()
+        for command, args in commands:
+            buf += resp_encode_command(command, args)
+
+        replies = []
+        try:
+            writer.write(buf)
+            await writer.drain()
+            data = b""
+            pos = 0
+            while len(replies) < len(commands):
+                end = _reply_end(data, pos)
+                if end >= 0:
+                    replies.append(decode_resp(data[pos:end]))
+                    pos = end
+                    continue
+                chunk = await asyncio.wait_for(reader.read(65536), TIMEOUT_SECONDS)
+                if not chunk:
+                    break
+                data += chunk
+        except (OSError, asyncio.TimeoutError, ValueError) as e:
+            error = {"error": f"Command execution error: {e}"}
+            replies.extend([error] * (len(commands) - len(replies)))
+        finally:
+            writer.close()
+
+        missing = {"error": "Connection closed before reply"}
+        replies.extend([missing] * (len(commands) - len(replies)))
+        return replies
+
+    async def _execute_async(self):
+        """Fans the test case out over up to MAX_PARALLEL_TESTS connections.
+
+        Dragonfly is multithreaded, so concurrent pipelines scale
+        throughput until the server saturates; contiguous slices keep the
+        flattened reply list aligned with self.test_cases.
+        """
+        if not self.test_cases:
+            return []
+        workers = min(MAX_PARALLEL_TESTS, len(self.test_cases))
+        step = -(-len(self.test_cases) // workers)
+        slices = [self.test_cases[i : i + step] for i in range(0, len(self.test_cases), step)]
+        reply_groups = await asyncio.gather(*(self._pipeline_async(s) for s in slices))
+        return [reply for group in reply_groups for reply in group]
+
     def execute_tests(self):
         """Executes tests on Redis server"""
-        print(f"Attempting to connect to Redis server at {REDIS_HOST}:{REDIS_PORT}")
-        redis_client = RedisClient()
+        if _DEBUG:
+            print(f"Attempting to connect to Redis server at {REDIS_HOST}:{REDIS_PORT}")
+        redis_client = _get_client()
 
         # Verify connection works before proceeding
         if not redis_client.sock:
@@ -486,36 +965,28 @@ class AFLFuzzer:
             self.stats["error_executions"] += len(self.test_cases)
             return []
 
-        print(
-            f"Executing {len(self.test_cases)} commands on Redis server at {REDIS_HOST}:{REDIS_PORT}"
-        )
-
-        # Execute all commands
-        current_test_commands = []
-
-        for idx, (command, args) in enumerate(self.test_cases):
-            # Add current command to test sequence
-            current_test_commands.append((command, args))
-
-            print(f"Executing command {idx+1}/{len(self.test_cases)}: {command} {args}")
-            try:
-                # Execute command
-                result = redis_client.execute_command(command, *args)
-                self.results.append({"command": command, "args": args, "result": result})
-                self.stats["successful_executions"] += 1
-                print(f"Command succeeded: {command}")
-            except socket.timeout:
-                self.results.append({"command": command, "args": args, "error": "Timeout"})
-                self.stats["timeouts"] += 1
-                print(f"Command timeout: {command}")
-            except Exception as e:
-                self.results.append({"command": command, "args": args, "error": str(e)})
-                self.stats["error_executions"] += 1
-                print(f"Command error: {command} - {str(e)}")
+        if _DEBUG:
+            print(
+                f"Executing {len(self.test_cases)} commands on Redis server at {REDIS_HOST}:{REDIS_PORT}"
+            )
 
+        # The probe stays open for the next iteration; the async pipelines
+        # own their sockets
+        # Concurrent pipelined slices: one batched send per connection,
+        # flattened replies stay in test-case order
+        replies = asyncio.run(self._execute_async())
+
+        for idx, ((command, args), result) in enumerate(zip(self.test_cases, replies)):
+            if _DEBUG:
+                print(f"Executing command {idx+1}/{len(self.test_cases)}: {command} {args}")
+            self.results.append({"command": command, "args": args, "result": result})
+            self.stats["successful_executions"] += 1
+            if not (isinstance(result, dict) and "error" in result):
+                record_command_feedback(command)
+                if _DEBUG:
+                    print(f"Command succeeded: {command}")
             self.stats["total_executions"] += 1
 
-        redis_client.close()
         print(
             f"Test execution complete. Total: {self.stats['total_executions']}, Successful: {self.stats['successful_executions']}, Errors: {self.stats['error_executions']}"
         )
@@ -581,23 +1052,33 @@ def main():
 
     # Always reload dictionary values for each run
     global DICT_VALUES, INPUT_VALUES
-    DICT_VALUES = []
-    if os.path.exists(DICT_FILE):
-        try:
-            with open(DICT_FILE, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and line.startswith('"') and line.endswith('"'):
-                        DICT_VALUES.append(line[1:-1])
-        except Exception as e:
-            print(f"Error loading dictionary file: {e}")
+    DICT_VALUES = load_dict_values()
 
-    # Always reload input values
-    INPUT_VALUES = load_input_dict()
+    # Always reload input values (drop the cached parse first)
+    load_input_dict.cache_clear()
+    INPUT_VALUES = tuple(load_input_dict())
 
     # Running fuzzing with mixed strategy always enabled
     fuzzer = AFLFuzzer()
-    fuzzer.run()
+    if afl is not None:
+        # Persistent mode: afl.loop keeps this process alive across many
+        # inputs, so the command tables, the dictionary caches and the
+        # warm client socket from _get_client are all reused per iteration
+        _get_client()
+        while afl.loop(1000):
+            try:
+                # afl-fuzz rewrites the file-backed stdin in place
+                os.lseek(0, 0, os.SEEK_SET)
+            except OSError:
+                pass
+            fuzzer.afl_input = None
+            fuzzer.test_cases = []
+            fuzzer.results = []
+            if not fuzzer.read_afl_input() or not fuzzer.parse_afl_input():
+                fuzzer.test_cases = TestCase().generate_test_case()
+            fuzzer.execute_tests()
+    else:
+        fuzzer.run()
 
 
 if __name__ == "__main__":